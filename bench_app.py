@@ -0,0 +1,179 @@
+"""Rerun benchmark for every page and selectbox option of the app.
+
+Drives organicvinorganic.py through streamlit's AppTest. For each page and
+for each option of every selectbox on it, the script is rerun several times
+and the wall time, the peak memory allocated during the rerun and the
+serialized size of the rendered elements are recorded. AppTest always reruns
+the whole script, so the element size is an upper bound on what a fragment
+rerun sends to the browser.
+
+Results are written as JSON so two commits can be compared:
+
+    python bench_app.py --output before.json
+    ... change something ...
+    python bench_app.py --output after.json --compare before.json
+
+or, in one go, against any git revision:
+
+    python bench_app.py --before HEAD~1
+
+--before extracts the whole tree at that revision with git archive and
+benchmarks it in its own process, so the old script runs against its own
+helper modules and data rather than the working tree's.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import tracemalloc
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP = "organicvinorganic.py"
+PAGES = ["Home", "Resource Guide"]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def payload_bytes(node):
+    """Serialized size of every element and block under an AppTest node."""
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None else 0
+    for child in getattr(node, "children", {}).values():
+        size += payload_bytes(child)
+    return size
+
+
+def timed_runs(at, runs):
+    times = []
+    peaks = []
+    for _ in range(runs):
+        tracemalloc.start()
+        start = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - start) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    if at.exception:
+        raise RuntimeError(f"App raised: {at.exception[0].value}")
+    return {
+        "wall_ms": {
+            "mean": statistics.mean(times),
+            "p50": percentile(times, 0.50),
+            "p95": percentile(times, 0.95),
+            "max": max(times),
+        },
+        "peak_kib": max(peaks) / 1024,
+        "payload_bytes": payload_bytes(at._tree),
+    }
+
+
+def bench_page(app_dir, page, runs):
+    at = AppTest.from_file(os.path.join(app_dir, APP), default_timeout=30)
+    at.run()
+    at.sidebar.radio[0].set_value(page)
+    results = [{"page": page, "widget": None, "option": None, **timed_runs(at, runs)}]
+    for index in range(len(at.selectbox)):
+        label = at.selectbox[index].label
+        for option in at.selectbox[index].options:
+            # Elements are rebuilt on every run, so look the widget up again
+            at.selectbox[index].set_value(option)
+            results.append({"page": page, "widget": label, "option": option, **timed_runs(at, runs)})
+    return results
+
+
+def git_commit(rev="HEAD"):
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", rev],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_revision(rev, runs):
+    """Benchmark the tree as it was at a git revision and return its report."""
+    archive = subprocess.run(["git", "archive", rev], cwd=ROOT, check=True, capture_output=True).stdout
+    with tempfile.TemporaryDirectory() as app_dir:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(app_dir, filter="data")
+        output = os.path.join(app_dir, "bench_before.json")
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--app-dir", app_dir, "--runs", str(runs), "--output", output],
+            check=True, stdout=subprocess.DEVNULL,
+        )
+        with open(output, encoding="utf-8") as f:
+            report = json.load(f)
+    report["commit"] = git_commit(rev)
+    return report
+
+
+def compare(current, previous):
+    def key(result):
+        return result["page"], result["widget"], result["option"]
+
+    before = {key(result): result for result in previous["results"]}
+    print(f"{'case':<60}{'ms':>10}{'change':>9}{'KiB':>10}{'change':>9}")
+    for result in current["results"]:
+        old = before.get(key(result))
+        name = " / ".join(str(part) for part in key(result) if part is not None)
+        ms = result["wall_ms"]["p50"]
+        kib = result["peak_kib"]
+        if old is None:
+            print(f"{name[:59]:<60}{ms:>10.2f}{'new':>9}{kib:>10.1f}{'new':>9}")
+            continue
+        ms_change = (ms / old["wall_ms"]["p50"] - 1) * 100
+        kib_change = (kib / old["peak_kib"] - 1) * 100
+        print(f"{name[:59]:<60}{ms:>10.2f}{ms_change:>+8.1f}%{kib:>10.1f}{kib_change:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="reruns per case")
+    parser.add_argument("--output", default="bench_app.json", help="where to write the JSON results")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    parser.add_argument("--before", metavar="REV", help="benchmark this git revision first and compare against it")
+    parser.add_argument("--app-dir", default=ROOT, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Run before importing the working tree's modules into this process
+    previous = bench_revision(args.before, args.runs) if args.before else None
+
+    # The app imports its helper modules and reads data/ relative to its own directory
+    os.chdir(args.app_dir)
+    sys.path.insert(0, args.app_dir)
+
+    report = {
+        "commit": git_commit() if args.app_dir == ROOT else None,
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "runs": args.runs,
+        "results": [result for page in PAGES for result in bench_page(args.app_dir, page, args.runs)],
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(report['results'])} cases to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+    if previous is not None:
+        print(f"Compared with {previous['commit'] or 'earlier results'}:")
+        compare(report, previous)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Concurrent load test against a locally launched copy of the app.
+
+Starts `streamlit run organicvinorganic.py` on a free port, opens many
+websocket sessions at once (speaking the same protobuf protocol as the
+browser) and has every session alternate between the two pages. Reports
+p50/p95/p99 rerun latency, the server's memory per session and errors, and
+writes them as JSON so runs can be compared between commits.
+
+Usage:
+    python bench_load.py --sessions 200 --reruns 10 --output bench_load.json
+
+Uses the websockets client, which is already installed with streamlit.
+Memory is read from /proc, so it is only reported on Linux.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import streamlit
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+import content
+from bench_app import git_commit, percentile
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(ROOT, "organicvinorganic.py")
+PAGES = ["Home", "Resource Guide"]
+# Each page's st.title, used to check that a rerun rendered the page asked for
+TITLES = {"Home": content.HOME_TITLE, "Resource Guide": content.RESOURCES_TITLE}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port):
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", APP,
+            "--server.port", str(port),
+            "--server.headless", "true",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError("streamlit exited before it became healthy")
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("streamlit did not become healthy within 60s")
+
+
+def rss_kib(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+class Session:
+    """One browser-like websocket session."""
+
+    def __init__(self, url):
+        self.url = url
+        self.connection = None
+        self.navigation_id = None
+
+    async def connect(self):
+        self.connection = await connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def rerun(self, page):
+        """Rerun the script on `page` and return the seconds until it finished.
+
+        Raises RuntimeError if the server rendered a different page.
+        """
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        if self.navigation_id is not None:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = self.navigation_id
+            widget.string_value = page
+        start = time.perf_counter()
+        await self.connection.send(msg.SerializeToString())
+        title = None
+        while True:
+            forward = ForwardMsg.FromString(await self.connection.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                if self.navigation_id is None:
+                    self._find_navigation(element)
+                if title is None and element.WhichOneof("type") == "heading" and element.heading.tag == "h1":
+                    title = element.heading.body
+            elif kind == "script_finished":
+                elapsed = time.perf_counter() - start
+                if title != TITLES[page]:
+                    raise RuntimeError(f"asked for {page!r} but the page title was {title!r}")
+                return elapsed
+
+    def _find_navigation(self, element):
+        # The sidebar radio's widget id is only known once the server sends it
+        if element.WhichOneof("type") == "radio" and element.radio.label == "Navigation":
+            self.navigation_id = element.radio.id
+
+    async def close(self):
+        if self.connection is not None:
+            await self.connection.close()
+
+
+async def run_session(url, reruns, latencies, errors, connected):
+    session = Session(url)
+    try:
+        await session.connect()
+        latencies.append(await session.rerun(PAGES[0]))
+        connected.append(session)
+        for i in range(reruns):
+            latencies.append(await session.rerun(PAGES[(i + 1) % len(PAGES)]))
+    except Exception as error:  # keep the other sessions going
+        errors.append(f"{type(error).__name__}: {error}")
+
+
+async def load_test(port, sessions, reruns, server_pid):
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+
+    # One session first so imports and caches are warm before measuring
+    warmup = Session(url)
+    await warmup.connect()
+    await warmup.rerun(PAGES[0])
+    await warmup.rerun(PAGES[1])
+    await warmup.close()
+    await asyncio.sleep(1)
+    rss_before = rss_kib(server_pid)
+
+    latencies = []
+    errors = []
+    connected = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_session(url, reruns, latencies, errors, connected) for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    # Measure while every session is still open
+    rss_after = rss_kib(server_pid)
+    await asyncio.gather(*(session.close() for session in connected))
+
+    latencies_ms = [latency * 1000 for latency in latencies]
+    memory = None
+    if rss_before is not None and rss_after is not None:
+        memory = {
+            "rss_before_kib": rss_before,
+            "rss_after_kib": rss_after,
+            "per_session_kib": (rss_after - rss_before) / max(len(connected), 1),
+        }
+    return {
+        "sessions": sessions,
+        "connected": len(connected),
+        "reruns_per_session": reruns + 1,
+        "elapsed_s": elapsed,
+        "reruns_per_s": len(latencies) / elapsed if elapsed else None,
+        "latency_ms": {
+            "p50": percentile(latencies_ms, 0.50),
+            "p95": percentile(latencies_ms, 0.95),
+            "p99": percentile(latencies_ms, 0.99),
+            "max": max(latencies_ms),
+        } if latencies_ms else None,
+        "memory": memory,
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:5],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100, help="concurrent websocket sessions")
+    parser.add_argument("--reruns", type=int, default=10, help="page switches per session")
+    parser.add_argument("--port", type=int, help="port for the server (default: any free port)")
+    parser.add_argument("--output", default="bench_load.json", help="where to write the JSON results")
+    args = parser.parse_args()
+
+    port = args.port or free_port()
+    server = start_server(port)
+    try:
+        result = asyncio.run(load_test(port, args.sessions, args.reruns, server.pid))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        **result,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    latency = report["latency_ms"] or {}
+    print(
+        f"{report['connected']}/{report['sessions']} sessions, "
+        f"p50 {latency.get('p50', 0):.1f} ms, p95 {latency.get('p95', 0):.1f} ms, "
+        f"p99 {latency.get('p99', 0):.1f} ms, {report['errors']} errors -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
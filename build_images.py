@@ -0,0 +1,72 @@
+"""Build resized, compressed copies of the chart images for the app.
+
+Every chart in images/ is written to static/charts/ at several widths as both
+WebP and JPEG. The file names carry a hash of their contents, so a rebuilt
+chart always gets a new URL and the files are safe to cache forever (see
+image_assets.py for the header a proxy or CDN needs to add). static/charts/manifest.json lists what was built and
+is what image_assets.py reads at runtime.
+
+Usage: python build_images.py
+Needs Pillow (pip install pillow).
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+
+from PIL import Image
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(ROOT, "images")
+OUTPUT_DIR = os.path.join(ROOT, "static", "charts")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+
+CHARTS = ["frequency", "pieChart"]
+WIDTHS = [320, 640, 960, 1280]
+FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 6},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+
+def encode(image, options):
+    buffer = io.BytesIO()
+    image.save(buffer, **options)
+    return buffer.getvalue()
+
+
+def build_chart(name):
+    with Image.open(os.path.join(SOURCE_DIR, f"{name}.jpg")) as source:
+        source = source.convert("RGB")
+        # Never upscale: the widest variant is the original width
+        widths = sorted({w for w in WIDTHS if w < source.width} | {source.width})
+        variants = []
+        for width in widths:
+            height = round(source.height * width / source.width)
+            resized = source if width == source.width else source.resize((width, height), Image.LANCZOS)
+            for ext, options in FORMATS.items():
+                data = encode(resized, options)
+                digest = hashlib.sha256(data).hexdigest()[:12]
+                filename = f"{name}-{width}w.{digest}.{ext}"
+                with open(os.path.join(OUTPUT_DIR, filename), "wb") as f:
+                    f.write(data)
+                variants.append({"width": width, "format": ext, "file": filename, "hash": digest, "bytes": len(data)})
+        return {"width": source.width, "height": source.height, "variants": variants}
+
+
+def main():
+    # Start from an empty directory so stale hashed files don't pile up
+    shutil.rmtree(OUTPUT_DIR, ignore_errors=True)
+    os.makedirs(OUTPUT_DIR)
+    manifest = {name: build_chart(name) for name in CHARTS}
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    for name, chart in manifest.items():
+        original = os.path.getsize(os.path.join(SOURCE_DIR, f"{name}.jpg"))
+        smallest = min(v["bytes"] for v in chart["variants"])
+        print(f"{name}: {len(chart['variants'])} variants, smallest {smallest / 1024:.0f} KiB (original {original / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
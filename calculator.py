@@ -0,0 +1,96 @@
+"""Organic price calculator for single items and whole shopping lists.
+
+Premiums are looked up in a Series indexed by (Item, StoreType), built once
+from the price table, so pricing an item is a hash lookup and pricing a
+catalog is one vectorized reindex instead of a filter per row.
+"""
+import pandas as pd
+
+# Store type of the premiums that apply to any store
+ALL_STORES = "all"
+
+# Columns an uploaded shopping list or catalog may have
+CATALOG_COLUMNS = {
+    "Category": "premium table item the product belongs to, e.g. Tea (required)",
+    "Price": "conventional price per unit (required)",
+    "Quantity": "units bought (optional, defaults to 1)",
+    "StoreType": "store type to price at, e.g. small or large (optional)",
+}
+
+
+def premium_index(price_df):
+    """Index the price table's PremiumPercent by (Item, StoreType)."""
+    premiums = price_df.set_index(["Item", "StoreType"])["PremiumPercent"].astype(float)
+    return premiums.sort_index()
+
+
+def premium_for(premiums, item, store_type=ALL_STORES):
+    """Return the premium (in percent) for one item, or None if it's unknown.
+
+    Falls back to the all-stores premium when there is none for store_type.
+    """
+    premium = premiums.get((item, store_type))
+    if premium is None and store_type != ALL_STORES:
+        premium = premiums.get((item, ALL_STORES))
+    return premium
+
+
+def organic_price(price, premium):
+    return price * (1 + premium / 100)
+
+
+def _numeric(values, column):
+    # Uploaded files can hold anything, e.g. "$2.00" or an empty cell
+    numbers = pd.to_numeric(values, errors="coerce")
+    bad = numbers.isna().to_numpy().nonzero()[0]
+    if len(bad):
+        rows = ", ".join(str(row + 1) for row in bad[:5]) + (", ..." if len(bad) > 5 else "")
+        raise ValueError(f"{column} must be a plain number in every row (check row(s) {rows})")
+    return numbers
+
+
+def price_catalog(catalog, premiums, store_type=ALL_STORES):
+    """Price every row of a catalog at organic prices in one pass.
+
+    Rows use their own StoreType column if the catalog has one, otherwise
+    store_type. Returns (priced, totals): the catalog with Premium,
+    OrganicPrice, ConventionalTotal and OrganicTotal columns added (NaN for
+    rows whose category has no premium), and a dict of basket totals over
+    the rows that could be priced. Raises ValueError if columns are missing
+    or Price/Quantity hold anything but numbers.
+    """
+    missing = [column for column in ("Category", "Price") if column not in catalog.columns]
+    if missing:
+        raise ValueError(f"Catalog is missing column(s): {', '.join(missing)}")
+
+    priced = catalog.copy()
+    if "Quantity" not in priced.columns:
+        priced["Quantity"] = 1
+    for column in ("Price", "Quantity"):
+        priced[column] = _numeric(priced[column], column)
+    stores = priced["StoreType"] if "StoreType" in priced.columns else pd.Series(store_type, index=priced.index)
+
+    # Exact (Category, StoreType) matches first, then the all-stores premium
+    exact = pd.MultiIndex.from_arrays([priced["Category"], stores])
+    fallback = pd.MultiIndex.from_arrays([priced["Category"], pd.Series(ALL_STORES, index=priced.index)])
+    premium = premiums.reindex(exact).to_numpy()
+    premium = pd.Series(premium, index=priced.index).fillna(
+        pd.Series(premiums.reindex(fallback).to_numpy(), index=priced.index)
+    )
+
+    priced["Premium"] = premium
+    priced["OrganicPrice"] = organic_price(priced["Price"], premium)
+    priced["ConventionalTotal"] = priced["Price"] * priced["Quantity"]
+    priced["OrganicTotal"] = priced["OrganicPrice"] * priced["Quantity"]
+
+    known = premium.notna()
+    conventional = priced.loc[known, "ConventionalTotal"].sum()
+    organic = priced.loc[known, "OrganicTotal"].sum()
+    totals = {
+        "items": int(known.sum()),
+        "unpriced": int((~known).sum()),
+        "conventional": conventional,
+        "organic": organic,
+        "extra": organic - conventional,
+    }
+    return priced, totals
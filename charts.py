@@ -0,0 +1,73 @@
+"""Native charts for the Home page.
+
+The charts are drawn from the cached aggregates in loaders.py, so the browser
+receives a small Vega-Lite spec instead of a rendered image. Building and
+validating an Altair chart takes tens of milliseconds, so the spec builders
+here are called once per data file by the cached loaders, and a rerun only
+hands the finished dict to show().
+"""
+import altair as alt
+import streamlit as st
+from streamlit.dataframe_util import convert_anything_to_arrow_bytes
+
+from calculator import ALL_STORES
+
+# Answer order on the survey charts (answers not listed here go last)
+FREQUENCY_ORDER = ["Daily", "Weekly", "Monthly", "Every 6 Months"]
+SHARE_ORDER = ["0%", "1-25%", "26-50%", "51%+"]
+
+
+def _question(summary, question):
+    return summary[summary["question"] == question].astype({"answer": str})
+
+
+def _spec(chart):
+    spec = chart.to_dict()
+    # Serialize the data to Arrow here, once; streamlit sends bytes datasets as they are
+    spec["datasets"] = {
+        name: convert_anything_to_arrow_bytes(rows) for name, rows in spec.get("datasets", {}).items()
+    }
+    return spec
+
+
+def frequency_spec(summary):
+    """Bar chart of how often students buy organic food."""
+    chart = alt.Chart(_question(summary, "frequency")).mark_bar(color="#4285f4").encode(
+        x=alt.X("answer:N", sort=FREQUENCY_ORDER, title="Frequency", axis=alt.Axis(labelAngle=0)),
+        y=alt.Y("percent:Q", title="Percentage of students"),
+        tooltip=[
+            alt.Tooltip("answer:N", title="Frequency"),
+            alt.Tooltip("percent:Q", title="Percent", format=".1f"),
+        ],
+    ).properties(title="Percentage of People that Buy Organic Food")
+    return _spec(chart)
+
+
+def share_spec(summary):
+    """Pie chart of the share of groceries students buy organic."""
+    base = alt.Chart(_question(summary, "organic_share")).encode(
+        theta=alt.Theta("percent:Q", stack=True),
+        color=alt.Color("answer:N", sort=SHARE_ORDER, title="Share of groceries"),
+        tooltip=[
+            alt.Tooltip("answer:N", title="Share"),
+            alt.Tooltip("percent:Q", title="Percent", format=".1f"),
+        ],
+    )
+    pie = base.mark_arc(outerRadius=140)
+    labels = base.mark_text(radius=170).encode(text=alt.Text("percent:Q", format=".1f"))
+    return _spec((pie + labels).properties(title="College Student Organic Purchase Levels"))
+
+
+def premium_spec(price_df):
+    """Bar chart of the all-stores organic premium for every item in the price table."""
+    chart = alt.Chart(price_df[price_df["StoreType"] == ALL_STORES]).mark_bar(color="#e69f00").encode(
+        x=alt.X("Item:N", sort=None, title=None, axis=alt.Axis(labelAngle=-45)),
+        y=alt.Y("PremiumPercent:Q", title="Price Premium (%)"),
+        tooltip=["Item", alt.Tooltip("PremiumPercent:Q", title="Premium (%)")],
+    ).properties(title="Organic vs Conventional Price Premiums")
+    return _spec(chart)
+
+
+def show(spec):
+    """Render a spec from one of the builders above (shared across sessions, so read-only)."""
+    st.vega_lite_chart(spec, use_container_width=True)
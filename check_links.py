@@ -0,0 +1,157 @@
+"""Check every source link and cache the results on disk.
+
+Resolves each DOI/URL in data/sources.json concurrently, over a shared,
+pooled aiohttp session with a cap on open requests, and records the status,
+the URL it ended up at and the page title in data/link_cache.json. The app
+only reads that file; it never touches the network while rendering.
+
+Working links are reused until they are older than --max-age-days, so
+rerunning the checker only fetches new, stale or failed links.
+
+Usage:
+    python check_links.py                       # check the corpus
+    python check_links.py --force               # ignore cached results
+    python check_links.py http://127.0.0.1:8000/a http://127.0.0.1:8000/b
+
+Links given on the command line are checked instead of the corpus, which is
+handy against a local stand-in server (e.g. python -m http.server).
+Needs aiohttp (pip install aiohttp).
+"""
+import argparse
+import asyncio
+import html
+import json
+import os
+import re
+import time
+
+import aiohttp
+
+from links import is_ok, normalize_url
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCES_PATH = os.path.join(ROOT, "data", "sources.json")
+CACHE_PATH = os.path.join(ROOT, "data", "link_cache.json")
+
+# Only the start of each page is read, enough to find its <title>
+TITLE_BYTES = 64 * 1024
+TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+HEADERS = {"User-Agent": "organicvinorganic-link-checker/1.0 (+source link validation)"}
+
+
+def corpus_links(path=SOURCES_PATH):
+    with open(path, encoding="utf-8") as f:
+        store = json.load(f)
+    return [record["link"] for record in store["sources"].values()]
+
+
+def load_cache(path=CACHE_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_cache(cache, path=CACHE_PATH):
+    # Write to a temporary file first so the app never reads half a file
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(temporary, path)
+
+
+def page_title(body, charset):
+    match = TITLE_RE.search(body)
+    if match is None:
+        return None
+    try:
+        title = match.group(1).decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        # The server named a charset Python doesn't know
+        title = match.group(1).decode("utf-8", errors="replace")
+    return " ".join(html.unescape(title).split()) or None
+
+
+async def read_head(response):
+    # read(n) returns whatever has arrived, so keep going until the title shows up
+    body = b""
+    while len(body) < TITLE_BYTES:
+        chunk = await response.content.read(TITLE_BYTES - len(body))
+        if not chunk:
+            break
+        body += chunk
+        if b"</title>" in body.lower():
+            break
+    return body
+
+
+async def check_url(session, semaphore, url):
+    """Fetch one URL, following redirects, and describe the outcome."""
+    entry = {"status": None, "final_url": None, "title": None, "error": None}
+    async with semaphore:
+        try:
+            async with session.get(url, allow_redirects=True) as response:
+                entry["status"] = response.status
+                entry["final_url"] = str(response.url)
+                if "html" in response.headers.get("Content-Type", ""):
+                    entry["title"] = page_title(await read_head(response), response.charset)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as error:
+            entry["error"] = f"{type(error).__name__}: {error}".strip()
+    entry["checked_at"] = time.time()
+    return url, entry
+
+
+async def check_urls(urls, concurrency=100, per_host=20, timeout=15):
+    """Check URLs concurrently and return {url: result}."""
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host, ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout, headers=HEADERS) as session:
+        results = await asyncio.gather(*(check_url(session, semaphore, url) for url in urls))
+    return dict(results)
+
+
+def stale(entry, max_age, now):
+    # Failures are always retried, so a timeout or a 503 doesn't stick for --max-age-days
+    return not is_ok(entry) or now - entry.get("checked_at", 0) > max_age
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("links", nargs="*", help="links to check instead of the corpus")
+    parser.add_argument("--cache", default=CACHE_PATH, help="where to read and write results")
+    parser.add_argument("--max-age-days", type=float, default=7, help="recheck working links older than this")
+    parser.add_argument("--force", action="store_true", help="recheck every link")
+    parser.add_argument("--concurrency", type=int, default=100, help="requests in flight at once")
+    parser.add_argument("--per-host", type=int, default=20, help="connections per host")
+    parser.add_argument("--timeout", type=float, default=15, help="seconds per link")
+    args = parser.parse_args()
+
+    links = args.links or corpus_links()
+    urls = sorted({normalize_url(link) for link in links})
+    for link in links:
+        if normalize_url(link) != link:
+            print(f"note: {link!r} is checked as {normalize_url(link)!r}")
+
+    cache = load_cache(args.cache)
+    now = time.time()
+    max_age = args.max_age_days * 24 * 60 * 60
+    todo = [url for url in urls if args.force or stale(cache.get(url), max_age, now)]
+
+    start = time.perf_counter()
+    if todo:
+        cache.update(asyncio.run(check_urls(todo, args.concurrency, args.per_host, args.timeout)))
+        save_cache(cache, args.cache)
+    elapsed = time.perf_counter() - start
+
+    broken = [url for url in urls if not is_ok(cache.get(url))]
+    print(f"Checked {len(todo)} of {len(urls)} links in {elapsed:.1f}s ({len(urls) - len(todo)} cached)")
+    for url in broken:
+        entry = cache[url]
+        print(f"  {entry['status'] or entry['error']}: {url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Static copy shown on the app's pages.
+
+Kept apart from organicvinorganic.py so export_static.py renders exactly the
+same text as the live app. Longer texts are Markdown.
+"""
+
+# Home page
+HOME_TITLE = "Organic vs Conventional: What Are You Really Paying For?"
+HOME_HEADER = "Organic ≠ Pesticide-Free"
+HOME_SUBHEADER = "The truth about organic food, pesticides, and what you're really paying for"
+HOME_INTRO = """\
+Many people believe that buying organic means buying pesticide-free food. In reality,
+organic farms are allowed to use pesticides—just ones derived from natural sources like
+plants, minerals, or bacteria. While there are differences in farming practices, large-scale
+studies haven't proven major health advantages from eating organic. What matters to consumers
+varies: some prioritize environmental impact, others care about farming practices, and many
+simply wonder if the higher price is worth it.
+"""
+
+MYTHS_HEADER = "Myth vs Fact"
+MYTHS = [
+    {
+        "myth": "Organic means no pesticides.",
+        "fact": "Organic farmers can use pesticides from plants, minerals, or bacteria. They're just required to use approved 'natural' pesticides and exhaust non-chemical methods first.",
+    },
+    {
+        "myth": "Organic is always healthier.",
+        "fact": "Large systematic reviews haven't found a major overall health advantage for organic diets. Some studies show associations with reduced disease risk, but evidence is limited.",
+    },
+    {
+        "myth": "Organic food has zero synthetic pesticide residue.",
+        "fact": "Up to 28% of organic produce in Europe contains trace residues of synthetic pesticides due to environmental contamination from nearby conventional farms.",
+    },
+    {
+        "myth": "All organic pesticides are safer than synthetic ones.",
+        "fact": "Some organic pesticides like copper fungicides can be highly toxic to non-target organisms and build up in soil over time.",
+    },
+]
+
+FREQUENCY_HEADER = "📊 How Often do Students Buy Organic"
+FREQUENCY_TEXT = """\
+We found survey data from college students to understand their organic food purchasing habits.
+The majority of students buy organic food monthly, with smaller groups purchasing
+weekly, daily, or every six months.
+"""
+
+SHARE_HEADER = "🥗 What Share of Groceries Are Organic"
+SHARE_TEXT = """\
+Most students (62%) buy some organic products, but they represent only 1-25% of their
+total groceries. This suggests that while students are interested in organic options,
+they're selective about when to spend extra for the organic label.
+"""
+
+PRICE_HEADER = "💰 Price Comparison: The Organic Premium"
+PRICE_TEXT = """\
+One of the biggest factors in choosing organic is cost. Below, you can explore how much
+more organic products cost compared to conventional options. The "organic premium" varies
+widely by product type.
+"""
+# Filled in with the selected item (lowercased for the sentence) and prices
+PREMIUM_LABEL = "Organic Premium for {item}"
+PREMIUM_EXAMPLE = "If a conventional {item} costs 10 dollars, the organic version would cost approximately {price:.2f} dollars."
+PRICE_WORTH_IT = """\
+**Is it worth paying more just for the organic label?** That depends on your priorities.
+If you're concerned about pesticide exposure, organic foods do reduce it—but they don't
+eliminate it entirely. If you're hoping for major health benefits, the scientific evidence
+is still inconclusive. The choice often comes down to personal values, budget, and what
+specific products matter most to you.
+"""
+
+BASKET_HEADER = "🧮 Price Your Own Basket"
+BASKET_TEXT = """\
+Want to know what switching your whole shopping list to organic would cost? Upload a list
+of products with their conventional prices, and we'll estimate the organic price of every
+item and of the basket as a whole.
+"""
+
+LEARN_MORE_HEADER = "📚 Want to Learn More?"
+LEARN_MORE_TEXT = """\
+All of the claims on this page are backed by peer-reviewed research and scientific studies.
+Click **"Resource Guide"** in the sidebar to explore the sources behind these findings and
+learn how to evaluate nutrition and food safety research for yourself.
+"""
+
+# Resource Guide page
+RESOURCES_TITLE = "📖 Resource Guide"
+RESOURCES_INTRO = """\
+This page collects key academic sources and research studies on pesticides, organic farming
+practices, health outcomes, and consumer behavior. Each source is summarized in plain language
+and organized by topic to help you understand the evidence behind our project's claims.
+"""
+
+READING_HEADER = "🔍 How to Read This Research"
+READING_INTRO = "When evaluating nutrition and food safety research, keep these tips in mind:"
+READING_TIPS = """\
+- **Check who funded the study.** Research funded by industry groups may have conflicts of interest.
+- **Look for large, peer-reviewed studies.** Single small studies can show interesting patterns, but large systematic reviews provide stronger evidence.
+- **Be cautious with headlines that oversimplify results.** "Associated with" doesn't mean "causes"—correlation isn't causation.
+- **Consider the study design.** Randomized controlled trials provide stronger evidence than observational studies.
+- **Look at the limitations section.** Good researchers acknowledge what their study can't prove.
+- **Seek multiple sources.** Don't base important decisions on a single study—look at the overall body of evidence.
+"""
+READING_NOTE = "💡 Remember: Science is an ongoing process. New evidence may strengthen, weaken, or nuance our current understanding of any topic."
+
+# Both pages
+FOOTER = "English 1101 Group Project | Organic vs Conventional Food Analysis"
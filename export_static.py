@@ -0,0 +1,299 @@
+"""Export the Home and Resource Guide pages as static HTML.
+
+Everything on the two pages except search and the basket calculator is the
+same for every visitor, so it can be served from any file server or CDN
+instead of a Python process per visitor. Every product and topic is rendered
+into the page up front; a few lines of JavaScript show the one picked in the
+selector (and the one named in the URL fragment, e.g. index.html#tea or
+resources.html#what-are-pesticides).
+Without JavaScript every variant is simply shown in turn.
+
+The charts are drawn as plain HTML bars from the same data files as the app,
+so the export never disagrees with it. Only when data/ has no survey file do
+the survey charts fall back to the images in images/.
+
+Usage:
+    python build_images.py      # optional, resized images for that fallback
+    python export_static.py --output dist --app-url https://example.streamlit.app
+
+--app-url links the exported pages to the live app for the interactive
+features that are left out of the export.
+"""
+import argparse
+import html
+import os
+import re
+import shutil
+
+import content
+from calculator import ALL_STORES, premium_for
+from charts import FREQUENCY_ORDER, SHARE_ORDER
+from image_assets import CHARTS_DIR, FULL_WIDTH, ORIGINALS_DIR, load_manifest, picture_html
+from loaders import load_premium_index, load_price_table, load_sources, load_survey_summary, source_link
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+STYLE = """\
+body{margin:0;font-family:system-ui,-apple-system,"Segoe UI",sans-serif;color:#31333f;line-height:1.6}
+nav{display:flex;gap:1.5rem;padding:1rem 2rem;background:#f0f2f6}
+nav a{color:#31333f;text-decoration:none;font-weight:600}
+main{max-width:1200px;margin:0 auto;padding:1rem 2rem}
+hr{border:0;border-top:1px solid #e6e6e6;margin:2rem 0}
+.grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(280px,1fr));gap:1rem 2rem}
+.columns{display:grid;grid-template-columns:1fr 2fr;gap:2rem;align-items:start}
+@media (max-width:640px){.columns{grid-template-columns:1fr}}
+.metric-label{font-size:.9rem}.metric-value{font-size:2.25rem}
+.button{display:inline-block;padding:.3rem .8rem;border:1px solid #d6d6d9;border-radius:.5rem;color:inherit;text-decoration:none}
+.info{background:#e8f0fe;border-radius:.5rem;padding:1rem}
+select{font-size:1rem;padding:.4rem;min-width:16rem}
+footer{max-width:1200px;margin:0 auto;padding:0 2rem 2rem;font-size:.85rem;color:#808495}
+.bars{display:grid;grid-template-columns:max-content 1fr;gap:.4rem 1rem;align-items:center;margin:0}
+.bars figcaption{grid-column:1/-1;font-weight:600}
+.bar{display:flex;align-items:center;gap:.5rem}
+.bar span{flex:none;height:1.2rem;border-radius:2px}
+.js .variant:not(.active){display:none}
+"""
+
+SCRIPT = """\
+document.querySelectorAll("select[data-group]").forEach(function (select) {
+  var group = select.dataset.group;
+  var variants = document.querySelectorAll('.variant[data-group="' + group + '"]');
+  function show(value) {
+    variants.forEach(function (variant) {
+      variant.classList.toggle("active", variant.dataset.variant === value);
+    });
+  }
+  var wanted = decodeURIComponent(location.hash.slice(1));
+  if (Array.prototype.some.call(select.options, function (option) { return option.value === wanted; })) {
+    select.value = wanted;
+  }
+  show(select.value);
+  select.addEventListener("change", function () {
+    show(select.value);
+    history.replaceState(null, "", "#" + select.value);
+  });
+});
+"""
+
+
+def slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def inline(text):
+    """Escape text and turn **bold** into <strong>."""
+    return re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html.escape(text, quote=False))
+
+
+def markdown_html(text):
+    """Render the small Markdown subset used in content.py: paragraphs, bullets and bold."""
+    blocks = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        lines = block.splitlines()
+        if all(line.startswith("- ") for line in lines):
+            items = "".join(f"<li>{inline(line[2:])}</li>" for line in lines)
+            blocks.append(f"<ul>{items}</ul>")
+        else:
+            blocks.append(f"<p>{inline(' '.join(line.strip() for line in lines))}</p>")
+    return "\n".join(blocks)
+
+
+def selector(label, group, options):
+    choices = "".join(f'<option value="{slug(option)}">{html.escape(option)}</option>' for option in options)
+    return f'<label>{html.escape(label)}<br><select data-group="{group}">{choices}</select></label>'
+
+
+def variant(group, name, body):
+    return f'<div class="variant" data-group="{group}" data-variant="{slug(name)}" id="{group}-{slug(name)}">{body}</div>'
+
+
+class ChartExporter:
+    """Copies chart images into the export and builds the tags that show them."""
+
+    def __init__(self, output_dir):
+        self.output_dir = os.path.join(output_dir, "charts")
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        os.makedirs(self.output_dir)
+        self.manifest = load_manifest()
+
+    def image(self, name, alt, sizes=FULL_WIDTH):
+        chart = (self.manifest or {}).get(name)
+        if chart is None:
+            # No resized variants were built, so ship the original
+            shutil.copy(os.path.join(ORIGINALS_DIR, f"{name}.jpg"), self.output_dir)
+            return f'<img src="charts/{name}.jpg" alt="{html.escape(alt)}" loading="lazy" style="width:100%;height:auto">'
+        for entry in chart["variants"]:
+            shutil.copy(os.path.join(CHARTS_DIR, entry["file"]), self.output_dir)
+        return picture_html(chart, alt, sizes, base_url="charts")
+
+
+def bar_chart(title, rows, color):
+    """Horizontal bar chart as plain HTML; rows are (label, value, value text)."""
+    top = max((value for _, value, _ in rows), default=0) or 1
+    # The longest bar takes 85% of the row, leaving room for its value
+    bars = "".join(
+        f"<div>{html.escape(label)}</div>"
+        f'<div class="bar"><span style="width:{max(value, 0) / top * 85:.1f}%;background:{color}"></span>'
+        f"{html.escape(text)}</div>"
+        for label, value, text in rows
+    )
+    return f'<figure class="bars"><figcaption>{html.escape(title)}</figcaption>{bars}</figure>'
+
+
+def premium_bars(price_df):
+    """Bar chart of the all-stores premiums, drawn from the price table."""
+    rows = price_df[price_df["StoreType"] == ALL_STORES]
+    premiums = [(item, premium, f"{premium:g}%") for item, premium in zip(rows["Item"], rows["PremiumPercent"])]
+    return bar_chart("Organic vs Conventional Price Premiums", premiums, "#e69f00")
+
+
+def survey_bars(summary, question, order, title):
+    """Bar chart of the answers to one survey question, in the same order as the app's chart."""
+    answers = summary[summary["question"] == question]
+    rank = {answer: position for position, answer in enumerate(order)}
+    rows = sorted(zip(answers["answer"].astype(str), answers["percent"]), key=lambda row: rank.get(row[0], len(order)))
+    return bar_chart(title, [(answer, percent, f"{percent:.1f}%") for answer, percent in rows], "#4285f4")
+
+
+def page(title, body, app_url):
+    live = f'<a href="{html.escape(app_url)}">Live app</a>' if app_url else ""
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<link rel="stylesheet" href="assets/style.css">
+<script>document.documentElement.className = "js";</script>
+</head>
+<body>
+<nav><a href="index.html">Home</a><a href="resources.html">Resource Guide</a>{live}</nav>
+<main>
+{body}
+</main>
+<footer><hr>{html.escape(content.FOOTER)}</footer>
+<script src="assets/app.js" defer></script>
+</body>
+</html>
+"""
+
+
+def home_page(charts, app_url):
+    price_df = load_price_table()
+    premiums = load_premium_index()
+    survey_summary = load_survey_summary()
+    items = price_df.loc[price_df["StoreType"] == ALL_STORES, "Item"].drop_duplicates().tolist()
+
+    myths = "".join(
+        f"<div><p><strong>❌ MYTH:</strong> {inline(myth['myth'])}</p>"
+        f"<p><strong>✅ FACT:</strong> {inline(myth['fact'])}</p></div>"
+        for myth in content.MYTHS
+    )
+    products = []
+    for item in items:
+        premium = premium_for(premiums, item)
+        organic_price = 10 + (10 * premium / 100)
+        products.append(variant("product", item, (
+            f'<div class="metric-label">{html.escape(content.PREMIUM_LABEL.format(item=item))}</div>'
+            f'<div class="metric-value">{premium:g}%</div>'
+            f"<p>{inline(content.PREMIUM_EXAMPLE.format(item=item.lower(), price=organic_price))}</p>"
+        )))
+    # Survey charts are drawn from the raw responses when we have them, like in the app
+    if survey_summary is not None:
+        frequency = survey_bars(survey_summary, "frequency", FREQUENCY_ORDER, "Percentage of People that Buy Organic Food")
+        share = survey_bars(survey_summary, "organic_share", SHARE_ORDER, "College Student Organic Purchase Levels")
+    else:
+        frequency = charts.image("frequency", "Bar chart of how often students buy organic food")
+        share = charts.image("pieChart", "Pie chart of the share of groceries students buy organic")
+    basket = ""
+    if app_url:
+        basket = (
+            f"<h2>{html.escape(content.BASKET_HEADER)}</h2>{markdown_html(content.BASKET_TEXT)}"
+            f'<p><a class="button" href="{html.escape(app_url)}">Open the calculator in the live app</a></p><hr>'
+        )
+
+    body = f"""
+<h1>{html.escape(content.HOME_TITLE)}</h1>
+<h2>{html.escape(content.HOME_HEADER)}</h2>
+<h3>{html.escape(content.HOME_SUBHEADER)}</h3>
+{markdown_html(content.HOME_INTRO)}
+<hr>
+<h2>{html.escape(content.MYTHS_HEADER)}</h2>
+<div class="grid">{myths}</div>
+<hr>
+<h2>{html.escape(content.FREQUENCY_HEADER)}</h2>
+{markdown_html(content.FREQUENCY_TEXT)}
+{frequency}
+<hr>
+<h2>{html.escape(content.SHARE_HEADER)}</h2>
+{markdown_html(content.SHARE_TEXT)}
+{share}
+<hr>
+<h2>{html.escape(content.PRICE_HEADER)}</h2>
+{markdown_html(content.PRICE_TEXT)}
+<div class="columns">
+<div>{selector("Select a product to see its organic premium:", "product", items)}{"".join(products)}</div>
+<div>{premium_bars(price_df)}</div>
+</div>
+{markdown_html(content.PRICE_WORTH_IT)}
+<hr>
+{basket}
+<h2>{html.escape(content.LEARN_MORE_HEADER)}</h2>
+{markdown_html(content.LEARN_MORE_TEXT)}
+"""
+    return page(content.HOME_TITLE, body, app_url)
+
+
+def resources_page(app_url):
+    sources = load_sources()
+    topics = []
+    for topic, topic_sources in sources.items():
+        entries = "".join(
+            f"<p><strong>{inline(source['citation'])}</strong></p>"
+            f"<p><strong>Summary:</strong> {inline(source['summary'])}</p>"
+            f"<p><strong>Why this matters:</strong> {inline(source['why'])}</p>"
+            f'<p><a class="button" href="{html.escape(source_link(source))}">Source</a></p><hr>'
+            for source in topic_sources
+        )
+        topics.append(variant("topic", topic, f"<h3>📑 {html.escape(topic)}</h3>{entries}"))
+    search = ""
+    if app_url:
+        search = f'<p>Looking for something specific? <a href="{html.escape(app_url)}">Search every source in the live app</a>.</p>'
+
+    body = f"""
+<h1>{html.escape(content.RESOURCES_TITLE)}</h1>
+{markdown_html(content.RESOURCES_INTRO)}
+<hr>
+{search}
+{selector("Choose a topic:", "topic", list(sources))}
+{"".join(topics)}
+<h2>{html.escape(content.READING_HEADER)}</h2>
+{markdown_html(content.READING_INTRO)}
+{markdown_html(content.READING_TIPS)}
+<p class="info">{inline(content.READING_NOTE)}</p>
+"""
+    return page(content.RESOURCES_TITLE, body, app_url)
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=os.path.join(ROOT, "dist"), help="directory to write the site to")
+    parser.add_argument("--app-url", help="URL of the live app, linked for search and the calculator")
+    args = parser.parse_args()
+
+    charts = ChartExporter(args.output)
+    write(os.path.join(args.output, "index.html"), home_page(charts, args.app_url))
+    write(os.path.join(args.output, "resources.html"), resources_page(args.app_url))
+    write(os.path.join(args.output, "assets", "style.css"), STYLE)
+    write(os.path.join(args.output, "assets", "app.js"), SCRIPT)
+    print(f"Exported to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Serve the chart images built by build_images.py.
+
+The variants live in static/charts/ and are served by streamlit's static file
+handler (server.enableStaticServing in .streamlit/config.toml), so the browser
+picks the right width for the screen from a srcset. Streamlit sends no
+Cache-Control header for static files, so for long-term caching the proxy or
+CDN in front of the app has to add one for /app/static/charts/, e.g.
+"Cache-Control: public, max-age=31536000, immutable". That is safe because
+every file name carries a hash of its contents. If the variants have not been
+built yet, charts fall back to st.image on the original JPEG.
+"""
+import html
+import json
+import os
+
+import streamlit as st
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CHARTS_DIR = os.path.join(ROOT, "static", "charts")
+MANIFEST_PATH = os.path.join(CHARTS_DIR, "manifest.json")
+ORIGINALS_DIR = os.path.join(ROOT, "images")
+STATIC_URL = "app/static/charts"
+
+# Layout hints for the sizes attribute. Columns stack below 640px.
+FULL_WIDTH = "100vw"
+TWO_THIRDS_WIDTH = "(max-width: 640px) 100vw, 66vw"
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _read_manifest(path, mtime):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_manifest():
+    """Return the build manifest, or None if build_images.py hasn't been run."""
+    try:
+        mtime = os.stat(MANIFEST_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_manifest(MANIFEST_PATH, mtime)
+
+
+def variant_url(variant, base_url=STATIC_URL):
+    return f"{base_url}/{variant['file']}"
+
+
+def srcset(chart, fmt, base_url=STATIC_URL):
+    return ", ".join(
+        f"{variant_url(v, base_url)} {v['width']}w" for v in chart["variants"] if v["format"] == fmt
+    )
+
+
+def picture_html(chart, alt, sizes, base_url=STATIC_URL):
+    """Build a <picture> tag offering WebP with a JPEG fallback at every width.
+
+    base_url is where the files in static/charts/ are served from.
+    """
+    largest_jpeg = max(
+        (v for v in chart["variants"] if v["format"] == "jpeg"), key=lambda v: v["width"]
+    )
+    alt = html.escape(alt, quote=True)
+    return (
+        "<picture>"
+        f'<source type="image/webp" srcset="{srcset(chart, "webp", base_url)}" sizes="{sizes}">'
+        f'<img src="{variant_url(largest_jpeg, base_url)}" srcset="{srcset(chart, "jpeg", base_url)}" sizes="{sizes}"'
+        f' width="{chart["width"]}" height="{chart["height"]}" alt="{alt}" loading="lazy"'
+        ' style="width:100%;height:auto">'
+        "</picture>"
+    )
+
+
+def chart_image(name, alt, sizes=FULL_WIDTH):
+    """Show one of the charts in images/ at the width the browser needs."""
+    manifest = load_manifest()
+    if manifest is None or name not in manifest:
+        st.image(os.path.join(ORIGINALS_DIR, f"{name}.jpg"), use_container_width=True)
+        return
+    st.markdown(picture_html(manifest[name], alt, sizes), unsafe_allow_html=True)
@@ -0,0 +1,39 @@
+"""Clean-up of source links, shared by the app and check_links.py."""
+import re
+
+DOI_RE = re.compile(r"^(?:doi:\s*)?(10\.\d{4,9}/\S+)$", re.IGNORECASE)
+# Punctuation that ends up after a link when it's copied out of a citation
+TRAILING = ".,;:"
+
+
+def normalize_url(link):
+    """Turn a link from the sources file into an absolute http(s) URL.
+
+    Strips trailing punctuation, turns bare DOIs into doi.org links and
+    adds https:// to links without a scheme.
+    """
+    url = link.strip().rstrip(TRAILING)
+    doi = DOI_RE.match(url)
+    if doi:
+        return f"https://doi.org/{doi.group(1)}"
+    if not re.match(r"^[a-z][a-z0-9+.-]*://", url, re.IGNORECASE):
+        url = f"https://{url}"
+    return url
+
+
+def is_ok(entry):
+    return entry is not None and entry.get("status") is not None and entry["status"] < 400
+
+
+def canonical_link(link, cache):
+    """Return the URL to send readers to for a link from the sources file.
+
+    DOI links stay on doi.org, since that's the address that lasts. Other
+    links use the address they ended up at when check_links.py last
+    resolved them. Anything unchecked or broken gets the cleaned-up link.
+    """
+    url = normalize_url(link)
+    entry = cache.get(url)
+    if is_ok(entry) and not url.startswith("https://doi.org/"):
+        return entry["final_url"]
+    return url
@@ -0,0 +1,253 @@
+"""Cached loaders for the data shown on both pages.
+
+Streamlit re-runs organicvinorganic.py from the top on every widget
+interaction, so anything built inline in the script is rebuilt on every
+click. These loaders read the files in data/ once per process and hand every
+session the same objects, so callers must treat the results as read-only.
+"""
+import io
+import json
+import os
+
+import pandas as pd
+import streamlit as st
+
+import telemetry
+from calculator import premium_index
+from charts import frequency_spec, premium_spec, share_spec
+from links import canonical_link
+from search import SourceIndex
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SOURCES_PATH = os.path.join(DATA_DIR, "sources.json")
+# Written by check_links.py; the app only ever reads it
+LINK_CACHE_PATH = os.path.join(DATA_DIR, "link_cache.json")
+# Tables can be CSV or Parquet; Parquet wins if both exist
+PRICE_PREMIUMS_PATHS = [
+    os.path.join(DATA_DIR, "price_premiums.parquet"),
+    os.path.join(DATA_DIR, "price_premiums.csv"),
+]
+# Raw survey answers, one row per answer
+SURVEY_PATHS = [
+    os.path.join(DATA_DIR, "survey_responses.parquet"),
+    os.path.join(DATA_DIR, "survey_responses.csv"),
+]
+
+# Cached copies are dropped after an hour even if the files never change
+CACHE_TTL = 60 * 60
+
+
+def _mtime(path):
+    # Part of every cache key, so editing a data file invalidates its entry
+    return os.stat(path).st_mtime_ns
+
+
+def _first_existing(paths):
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def read_table(path, columns=None, dtype=None):
+    """Read a CSV or Parquet file, depending on its extension."""
+    if path.endswith(".parquet"):
+        table = pd.read_parquet(path, columns=columns)
+        return table.astype(dtype) if dtype else table
+    return pd.read_csv(path, usecols=columns, dtype=dtype)
+
+
+def read_responses(path):
+    """Read a survey file with columns question, answer as categoricals."""
+    return read_table(path, columns=["question", "answer"], dtype="category")
+
+
+def summarize_responses(responses):
+    """Count the answers to each question and turn them into percentages.
+
+    Both columns are categorical, so the groupby works on integer codes and
+    stays fast for surveys with millions of rows.
+    """
+    counts = (
+        responses.groupby(["question", "answer"], observed=True, sort=False)
+        .size()
+        .rename("count")
+        .reset_index()
+    )
+    totals = counts.groupby("question", observed=True)["count"].transform("sum")
+    counts["percent"] = counts["count"] * 100 / totals
+    return counts
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def _read_price_table(path, mtime):
+    telemetry.cache_miss("price_table")
+    return read_table(path)
+
+
+def index_sources(store):
+    """Resolve a normalized source store into a dict of topic -> list of sources.
+
+    The store keeps every source once under "sources", keyed by DOI (or URL
+    when there is no DOI), and lists each topic's members by id under
+    "topics". A member can also be an object with an "id" plus fields that
+    replace the record's own for that topic only. Plain members resolve to
+    the shared record dict itself, so a source in several topics is still
+    held in memory once.
+    """
+    records = store["sources"]
+    for source_id, record in records.items():
+        record["id"] = source_id
+    topics = {}
+    for topic, members in store["topics"].items():
+        resolved = []
+        for member in members:
+            if isinstance(member, str):
+                resolved.append(records[member])
+            else:
+                resolved.append({**records[member["id"]], **member})
+        topics[topic] = resolved
+    return topics
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def _read_sources(path, mtime):
+    telemetry.cache_miss("sources")
+    with open(path, encoding="utf-8") as f:
+        return index_sources(json.load(f))
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def _read_survey_summary(path, mtime):
+    telemetry.cache_miss("survey_summary")
+    # Only the small aggregate is cached; the raw responses are dropped here
+    return summarize_responses(read_responses(path))
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def _build_survey_charts(path, mtime):
+    telemetry.cache_miss("survey_charts")
+    telemetry.cache_call("survey_summary")
+    summary = _read_survey_summary(path, mtime)
+    return {"frequency": frequency_spec(summary), "share": share_spec(summary)}
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def _build_premium_index(path, mtime):
+    telemetry.cache_miss("premium_index")
+    telemetry.cache_call("price_table")
+    return premium_index(_read_price_table(path, mtime))
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def _build_premium_chart(path, mtime):
+    telemetry.cache_miss("premium_chart")
+    telemetry.cache_call("price_table")
+    return premium_spec(_read_price_table(path, mtime))
+
+
+def _price_table_path():
+    path = _first_existing(PRICE_PREMIUMS_PATHS)
+    if path is None:
+        raise FileNotFoundError(f"No price premium table in {DATA_DIR}")
+    return path
+
+
+def load_price_table():
+    """Return the organic premium table (columns Item, StoreType, PremiumPercent)."""
+    telemetry.cache_call("price_table")
+    path = _price_table_path()
+    return _read_price_table(path, _mtime(path))
+
+
+def load_premium_index():
+    """Return PremiumPercent as a Series indexed by (Item, StoreType)."""
+    telemetry.cache_call("premium_index")
+    path = _price_table_path()
+    return _build_premium_index(path, _mtime(path))
+
+
+def load_premium_chart():
+    """Return the Vega-Lite spec of the premium chart, built from the price table."""
+    telemetry.cache_call("premium_chart")
+    path = _price_table_path()
+    return _build_premium_chart(path, _mtime(path))
+
+
+def load_sources():
+    """Return the Resource Guide sources as a dict of topic -> list of sources."""
+    telemetry.cache_call("sources")
+    return _read_sources(SOURCES_PATH, _mtime(SOURCES_PATH))
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def _build_search_index(path, mtime):
+    telemetry.cache_miss("search_index")
+    telemetry.cache_call("sources")
+    return SourceIndex.from_topics(_read_sources(path, mtime))
+
+
+def load_search_index():
+    """Return the keyword index over every source's citation, summary and why."""
+    telemetry.cache_call("search_index")
+    return _build_search_index(SOURCES_PATH, _mtime(SOURCES_PATH))
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=8, show_spinner="Reading file...")
+def _read_uploaded_table(name, data):
+    telemetry.cache_miss("uploads")
+    if name.endswith(".parquet"):
+        return pd.read_parquet(io.BytesIO(data))
+    return pd.read_csv(io.BytesIO(data))
+
+
+def read_uploaded_table(name, data):
+    """Read an uploaded CSV or Parquet file, cached by its name and contents."""
+    telemetry.cache_call("uploads")
+    return _read_uploaded_table(name, data)
+
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=1, show_spinner=False)
+def _read_link_cache(path, mtime):
+    telemetry.cache_miss("link_cache")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_link_cache():
+    """Return check_links.py's results by URL, or {} if it hasn't been run."""
+    try:
+        mtime = _mtime(LINK_CACHE_PATH)
+    except FileNotFoundError:
+        return {}
+    telemetry.cache_call("link_cache")
+    return _read_link_cache(LINK_CACHE_PATH, mtime)
+
+
+def source_link(source):
+    """Return the URL a source's "Source" button should open."""
+    return canonical_link(source["link"], load_link_cache())
+
+
+def load_survey_summary():
+    """Return answer counts and percentages per survey question.
+
+    Returns None if there is no survey file in data/.
+    """
+    path = _first_existing(SURVEY_PATHS)
+    if path is None:
+        return None
+    telemetry.cache_call("survey_summary")
+    return _read_survey_summary(path, _mtime(path))
+
+
+def load_survey_charts():
+    """Return the Vega-Lite specs of the survey charts as {"frequency": ..., "share": ...}.
+
+    Returns None if there is no survey file in data/.
+    """
+    path = _first_existing(SURVEY_PATHS)
+    if path is None:
+        return None
+    telemetry.cache_call("survey_charts")
+    return _build_survey_charts(path, _mtime(path))
@@ -0,0 +1,147 @@
+"""Keyword search over the Resource Guide sources.
+
+SourceIndex builds an inverted index (token -> {source number: term count})
+over every source's citation, summary and "why this matters" text once, so a
+query only touches the sources that contain its words instead of scanning
+every summary. Results are ranked with BM25 and come with a short snippet
+that has the matching words in bold.
+"""
+import bisect
+import heapq
+import math
+import re
+from collections import Counter
+
+FIELDS = ("citation", "summary", "why")
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Usual BM25 parameters
+K1 = 1.2
+B = 0.75
+
+SNIPPET_WORDS = 30
+# Prefix matching of the last query word
+MIN_PREFIX = 3
+MAX_EXPANSIONS = 10
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+class SourceIndex:
+    """Inverted index over a list of (source id, source, texts) documents.
+
+    Build it with SourceIndex.from_topics so that topic-specific summaries
+    are searchable too; each source still appears once in the results.
+    """
+
+    def __init__(self, documents):
+        self.sources = []
+        self.texts = []
+        self.lengths = []
+        self.postings = {}
+        seen = {}
+        for source_id, source, texts in documents:
+            if source_id in seen:
+                # Same source listed under another topic, maybe with its own summary
+                known = self.texts[seen[source_id]]
+                known.extend(text for text in texts if text not in known)
+                continue
+            seen[source_id] = len(self.sources)
+            self.sources.append(source)
+            self.texts.append(list(texts))
+        for doc, texts in enumerate(self.texts):
+            counts = Counter(token for text in texts for token in tokenize(text))
+            self.lengths.append(sum(counts.values()))
+            for token, count in counts.items():
+                self.postings.setdefault(token, {})[doc] = count
+        self.vocabulary = sorted(self.postings)
+        self.average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0
+
+    @classmethod
+    def from_topics(cls, topics):
+        """Index the topic -> sources dict returned by loaders.load_sources."""
+        documents = []
+        for sources in topics.values():
+            for source in sources:
+                texts = [source[field] for field in FIELDS if source.get(field)]
+                documents.append((source["id"], source, texts))
+        return cls(documents)
+
+    def _expand(self, token):
+        # The last word of a query may still be being typed, so match it as a
+        # prefix, keeping only the most common completions of short prefixes
+        if len(token) < MIN_PREFIX:
+            return [token] if token in self.postings else []
+        start = bisect.bisect_left(self.vocabulary, token)
+        end = bisect.bisect_left(self.vocabulary, token + "\uffff")
+        terms = self.vocabulary[start:end]
+        if len(terms) > MAX_EXPANSIONS:
+            terms = heapq.nlargest(MAX_EXPANSIONS, terms, key=lambda term: len(self.postings[term]))
+        return terms
+
+    def search(self, query, limit=20):
+        """Return up to `limit` (source, snippet) pairs, best match first.
+
+        A source matches only if it contains every word in the query.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # One group of index terms per query word; the last word matches by prefix
+        groups = [[token] if token in self.postings else [] for token in tokens[:-1]]
+        groups.append(self._expand(tokens[-1]))
+        if not all(groups):
+            return []
+
+        candidates = None
+        for terms in sorted(groups, key=lambda terms: sum(len(self.postings[t]) for t in terms)):
+            docs = set()
+            for term in terms:
+                docs.update(self.postings[term])
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return []
+
+        total = len(self.sources)
+        scores = dict.fromkeys(candidates, 0.0)
+        for term in {term for terms in groups for term in terms}:
+            posting = self.postings[term]
+            idf = math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            # Walk whichever of the posting list and the candidates is shorter
+            if len(posting) < len(candidates):
+                matches = ((doc, count) for doc, count in posting.items() if doc in candidates)
+            else:
+                matches = ((doc, posting[doc]) for doc in candidates if doc in posting)
+            for doc, count in matches:
+                norm = K1 * (1 - B + B * self.lengths[doc] / self.average_length)
+                scores[doc] += idf * count * (K1 + 1) / (count + norm)
+
+        ranked = heapq.nsmallest(limit, candidates, key=lambda doc: (-scores[doc], doc))
+        pattern = _highlight_pattern(groups)
+        return [(self.sources[doc], snippet(self.texts[doc], pattern)) for doc in ranked]
+
+
+def _highlight_pattern(groups):
+    # Bold exactly the index terms the query matched, so a short or heavily
+    # expanded last word doesn't light up completions the search didn't use
+    terms = sorted({term for terms in groups for term in terms}, key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, terms)) + r")\b", re.IGNORECASE)
+
+
+def snippet(texts, pattern):
+    """Cut a window of words around the first match and bold every match in it."""
+    for text in texts:
+        match = pattern.search(text)
+        if match is None:
+            continue
+        words = text.split()
+        position = len(text[:match.start()].split())
+        start = max(0, position - SNIPPET_WORDS // 3)
+        window = " ".join(words[start:start + SNIPPET_WORDS])
+        window = pattern.sub(lambda m: f"**{m.group(0)}**", window)
+        prefix = "… " if start > 0 else ""
+        suffix = " …" if start + SNIPPET_WORDS < len(words) else ""
+        return prefix + window + suffix
+    return ""
@@ -0,0 +1,261 @@
+"""Opt-in timing and memory telemetry for the app.
+
+Set ORGANIC_TELEMETRY=1 to turn it on. The app then records how long each
+page section takes, how often the script reruns, how often the cached loaders
+hit, and how big each session's st.session_state is. The numbers are shown
+on a hidden Telemetry page (add ?admin=1 to the URL) and, if
+ORGANIC_TELEMETRY_PORT is set, served in Prometheus text format at
+http://localhost:<port>/metrics.
+
+When telemetry is off, section() hands back one shared no-op context
+manager, timed() returns the function unchanged and the record/count
+helpers return straight away, so the app pays for little more than a
+function call per section.
+"""
+import bisect
+import contextlib
+import functools
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("ORGANIC_TELEMETRY") == "1"
+PORT = os.environ.get("ORGANIC_TELEMETRY_PORT")
+
+# Histogram bucket upper bounds for section timings, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# Session state sizes are kept for this many recent sessions
+MAX_SESSIONS = 1000
+SESSION_KEY = "_telemetry_session_id"
+
+_NOOP = contextlib.nullcontext()
+_lock = threading.Lock()
+_sections = {}
+_reruns = {}
+_cache_calls = {}
+_cache_misses = {}
+_session_state_bytes = OrderedDict()
+_server = None
+# Set when the metrics server couldn't start, so later reruns don't retry
+_server_failed = False
+_logger = logging.getLogger(__name__)
+
+
+class _SectionStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+
+class _Section:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        record_time(self.name, time.perf_counter() - self.start)
+
+
+def record_time(name, seconds):
+    with _lock:
+        stats = _sections.get(name)
+        if stats is None:
+            stats = _sections[name] = _SectionStats()
+        stats.add(seconds)
+
+
+def section(name):
+    """Context manager that times the block under `name`."""
+    if not ENABLED:
+        return _NOOP
+    return _Section(name)
+
+
+def timed(name):
+    """Decorator version of section(), e.g. for fragment functions."""
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with _Section(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _increment(counter, key):
+    with _lock:
+        counter[key] = counter.get(key, 0) + 1
+
+
+def record_rerun(page):
+    if ENABLED:
+        _increment(_reruns, page)
+
+
+def cache_call(cache):
+    """Count a lookup in one of the loaders' caches."""
+    if ENABLED:
+        _increment(_cache_calls, cache)
+
+
+def cache_miss(cache):
+    """Count a lookup that had to load from disk (call it inside the cached function)."""
+    if ENABLED:
+        _increment(_cache_misses, cache)
+
+
+def _value_size(value):
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:  # widgets can hold values that don't pickle
+        return sys.getsizeof(value)
+
+
+def record_session_state(session_state):
+    """Record the approximate size in bytes of one session's state."""
+    if not ENABLED:
+        return
+    if SESSION_KEY not in session_state:
+        session_state[SESSION_KEY] = uuid.uuid4().hex
+    session_id = session_state[SESSION_KEY]
+    size = sum(_value_size(session_state[key]) for key in list(session_state.keys()))
+    with _lock:
+        _session_state_bytes[session_id] = size
+        _session_state_bytes.move_to_end(session_id)
+        while len(_session_state_bytes) > MAX_SESSIONS:
+            _session_state_bytes.popitem(last=False)
+
+
+def snapshot():
+    """Return a copy of everything recorded so far, as plain dicts."""
+    with _lock:
+        sections = {
+            name: {
+                "count": stats.count,
+                "total_ms": stats.total * 1000,
+                "mean_ms": stats.total * 1000 / stats.count,
+                "max_ms": stats.max * 1000,
+            }
+            for name, stats in _sections.items()
+        }
+        caches = {}
+        for cache, calls in _cache_calls.items():
+            misses = _cache_misses.get(cache, 0)
+            caches[cache] = {
+                "calls": calls,
+                "misses": misses,
+                "hit_rate": max(calls - misses, 0) / calls,
+            }
+        sizes = list(_session_state_bytes.values())
+        return {
+            "sections": sections,
+            "reruns": dict(_reruns),
+            "caches": caches,
+            "session_state": {
+                "sessions": len(sizes),
+                "mean_bytes": sum(sizes) / len(sizes) if sizes else 0,
+                "max_bytes": max(sizes, default=0),
+            },
+        }
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus():
+    """Render the current numbers in the Prometheus text exposition format."""
+    lines = [
+        "# HELP organic_section_seconds Time spent rendering each page section.",
+        "# TYPE organic_section_seconds histogram",
+    ]
+    with _lock:
+        for name, stats in sorted(_sections.items()):
+            cumulative = 0
+            for bound, count in zip(BUCKETS + (float("inf"),), stats.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'organic_section_seconds_bucket{{section="{_label(name)}",le="{le}"}} {cumulative}')
+            lines.append(f'organic_section_seconds_sum{{section="{_label(name)}"}} {stats.total}')
+            lines.append(f'organic_section_seconds_count{{section="{_label(name)}"}} {stats.count}')
+
+        lines += ["# HELP organic_reruns_total Script reruns per page.", "# TYPE organic_reruns_total counter"]
+        lines += [f'organic_reruns_total{{page="{_label(page)}"}} {count}' for page, count in sorted(_reruns.items())]
+
+        lines += ["# HELP organic_cache_calls_total Lookups per loader cache.", "# TYPE organic_cache_calls_total counter"]
+        lines += [f'organic_cache_calls_total{{cache="{_label(cache)}"}} {count}' for cache, count in sorted(_cache_calls.items())]
+        lines += ["# HELP organic_cache_misses_total Lookups that loaded from disk.", "# TYPE organic_cache_misses_total counter"]
+        lines += [f'organic_cache_misses_total{{cache="{_label(cache)}"}} {count}' for cache, count in sorted(_cache_misses.items())]
+
+        sizes = list(_session_state_bytes.values())
+    lines += [
+        "# HELP organic_session_state_bytes Approximate st.session_state size of recent sessions.",
+        "# TYPE organic_session_state_bytes gauge",
+        f'organic_session_state_bytes{{stat="mean"}} {sum(sizes) / len(sizes) if sizes else 0}',
+        f'organic_session_state_bytes{{stat="max"}} {max(sizes, default=0)}',
+        "# HELP organic_sessions_tracked Sessions whose state size is being tracked.",
+        "# TYPE organic_sessions_tracked gauge",
+        f"organic_sessions_tracked {len(sizes)}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_metrics_server():
+    """Serve /metrics on ORGANIC_TELEMETRY_PORT, once per process.
+
+    If the port is taken (e.g. by another app process with the same
+    environment) or invalid, a warning is logged once and the app carries on
+    without the endpoint.
+    """
+    global _server, _server_failed
+    if not ENABLED or not PORT or _server is not None or _server_failed:
+        return
+    with _lock:
+        if _server is not None or _server_failed:
+            return
+        try:
+            _server = ThreadingHTTPServer(("127.0.0.1", int(PORT)), _MetricsHandler)
+        except (OSError, ValueError) as error:
+            _server_failed = True
+            _logger.warning("Telemetry metrics server not started on port %s: %s", PORT, error)
+            return
+    threading.Thread(target=_server.serve_forever, name="telemetry-metrics", daemon=True).start()
@@ -0,0 +1,119 @@
+"""check_links.check_urls against a local stand-in HTTP server.
+
+Run with: python -m pytest test_check_links.py
+"""
+import asyncio
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from check_links import check_urls, stale  # noqa: E402
+
+PAGES = {
+    "/ok": (200, "text/html; charset=utf-8", "<html><head><title>\n  Organic &amp; You\n</title></head></html>"),
+    "/bogus-charset": (200, "text/html; charset=bogus-xyz", "<title>Café</title>"),
+    "/plain": (200, "text/plain", "<title>not html</title>"),
+    "/missing": (404, "text/html", "<title>Not Found</title>"),
+    "/broken": (503, "text/html", "<title>Try again later</title>"),
+}
+
+
+class StandIn(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/redirect":
+            self.send_response(301)
+            self.send_header("Location", "/ok")
+            self.end_headers()
+            return
+        if self.path == "/slow":
+            time.sleep(2)
+        status, content_type, body = PAGES.get(self.path, PAGES["/missing"])
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def closed_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def check(*urls, timeout=5):
+    return asyncio.run(check_urls(list(urls), concurrency=4, per_host=4, timeout=timeout))
+
+
+def test_ok_page_has_status_and_title(server):
+    entry = check(f"{server}/ok")[f"{server}/ok"]
+    assert entry["status"] == 200
+    assert entry["final_url"] == f"{server}/ok"
+    assert entry["title"] == "Organic & You"
+    assert entry["error"] is None
+    assert entry["checked_at"] > 0
+
+
+def test_redirect_records_final_url(server):
+    entry = check(f"{server}/redirect")[f"{server}/redirect"]
+    assert entry["status"] == 200
+    assert entry["final_url"] == f"{server}/ok"
+    assert entry["title"] == "Organic & You"
+
+
+def test_http_errors_keep_status(server):
+    results = check(f"{server}/missing", f"{server}/broken")
+    assert results[f"{server}/missing"]["status"] == 404
+    assert results[f"{server}/broken"]["status"] == 503
+
+
+def test_unknown_charset_does_not_abort_the_run(server):
+    results = check(f"{server}/bogus-charset", f"{server}/ok")
+    assert results[f"{server}/bogus-charset"]["status"] == 200
+    assert results[f"{server}/bogus-charset"]["title"] == "Café"
+    assert results[f"{server}/ok"]["title"] == "Organic & You"
+
+
+def test_non_html_has_no_title(server):
+    entry = check(f"{server}/plain")[f"{server}/plain"]
+    assert entry["status"] == 200
+    assert entry["title"] is None
+
+
+def test_connection_and_timeout_errors(server):
+    refused = f"http://127.0.0.1:{closed_port()}/"
+    results = check(refused, f"{server}/slow", timeout=0.5)
+    for url in (refused, f"{server}/slow"):
+        assert results[url]["status"] is None
+        assert results[url]["error"]
+    assert results[f"{server}/slow"]["error"].startswith("TimeoutError")
+
+
+def test_failures_are_always_stale():
+    now = time.time()
+    day = 24 * 60 * 60
+    assert stale(None, day, now)
+    assert stale({"status": None, "checked_at": now}, day, now)
+    assert stale({"status": 503, "checked_at": now}, day, now)
+    assert not stale({"status": 200, "checked_at": now}, day, now)
+    assert stale({"status": 200, "checked_at": now - 2 * day}, day, now)